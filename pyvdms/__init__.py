@@ -17,17 +17,41 @@ extensions to the NMS Client of the IDC of the CTBTO.
     (https://www.gnu.org/licenses/gpl-3.0.en.html)
 """
 
-# Import some modules
-from pyvdms import util
-
-# Import some functions and classes
-from pyvdms.vdms import messages, Request, Client
-from pyvdms.filesystem import waveforms2SDS
-
 # Make only a selection available to __all__ to not clutter the namespace
 # Maybe also to discourage the use of `from PyVDMS import *`.
 __all__ = ['util', 'messages', 'Request', 'Client', 'waveforms2SDS']
 
+# Map the public attributes to their defining module so they can be
+# imported lazily (PEP 562): importing pyvdms does not pull in the heavy
+# obspy and pandas dependencies until an attribute is actually used.
+_lazy_imports = {
+    'util': ('pyvdms.util', None),
+    'messages': ('pyvdms.vdms.messages', None),
+    'Request': ('pyvdms.vdms.request', 'Request'),
+    'Client': ('pyvdms.vdms.client', 'Client'),
+    'waveforms2SDS': ('pyvdms.filesystem.waveforms2SDS', 'waveforms2SDS'),
+}
+
+
+def __getattr__(name):
+    """Lazily import the public modules, functions and classes.
+    """
+    try:
+        module, attr = _lazy_imports[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    from importlib import import_module
+    obj = import_module(module)
+    obj = getattr(obj, attr) if attr else obj
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
+
 # Version
 try:
     # - Released versions just tags:       1.10.0
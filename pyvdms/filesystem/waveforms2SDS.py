@@ -1,6 +1,10 @@
 # Mandatory imports
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 import pandas as pd
-from obspy import UTCDateTime, Stream
+from obspy import UTCDateTime, Stream, read
 from obspy.clients.filesystem.sds import Client as SDS_Client
 from humanfriendly import format_size, parse_size
 
@@ -16,6 +20,46 @@ from .stream2SDS import stream2SDS
 __all__ = ['waveforms2SDS']
 
 
+# byte-size formatting is pure; memoize repeated lookups of the same size
+format_size = lru_cache(maxsize=32)(format_size)
+parse_size = lru_cache(maxsize=32)(parse_size)
+
+
+@lru_cache(maxsize=16)
+def _fetch_channels(station: str, channel: str, month: str):
+    """Submit a Channel request for the station and channel selection.
+
+    Memoized at module level and keyed by the calendar month, so
+    iterative syncs within the same process (scheduler runs, backfill
+    reruns) skip the metadata round-trip while the inventory still
+    refreshes monthly. Returns the inventory DataFrame and the request
+    size in bytes.
+    """
+    request = Request(Channel(station, channel))
+
+    inventory = request.submit()
+
+    return inventory, request.size_bytes
+
+
+@lru_cache(maxsize=4096)
+def _fetch_chan_status(prefix: str, day_iso: str):
+    """Submit a Chan_status request for a station prefix and day.
+
+    Memoized at module level so repeated invocations of
+    :func:`waveforms2SDS` within the same process (scheduler runs,
+    restarts after a quota block) reuse the response instead of issuing
+    another network round-trip. Returns the status DataFrame and the
+    request size in bytes.
+    """
+    request = Request(Chan_status(station=prefix, channel='*',
+                                  starttime=day_iso))
+
+    status = request.submit()
+
+    return status, request.size_bytes
+
+
 def waveforms2SDS(
     station: str, channel: str, starttime, endtime, sds_root: str,
     threshold: float = 300., sds_qc: bool = True, request_limit=None,
@@ -136,202 +180,298 @@ def waveforms2SDS(
     log.info('')
     log.heading('Request station and channel metadata', 2)
 
-    request.message = Channel(station, channel)
-
-    log.debug('Request message:')
-    log.debug(str(request.message))
-
     log.debug('Send the request message.')
-    inv = request.submit()
 
-    log.debug('Got an answer.\nThis is the summary.')
-    log.debug(str(request))
+    misses = _fetch_channels.cache_info().misses
+    inv, size_bytes = _fetch_channels(
+        station, channel, pd.Timestamp.now().strftime('%Y%m')
+    )
 
-    log.debug('Returned data:')
-    log.debug(str(inv))
+    # only meter traffic that actually went over the wire
+    if _fetch_channels.cache_info().misses != misses:
+        request_size += size_bytes
 
-    request_size += request.size_bytes
+    if log.debug_enabled:
+        log.debug('Returned data:')
+        log.debug(str(inv))
 
     if not isinstance(inv, pd.DataFrame):
         return Response(
             success=False, error='No station information returned.'
         )
 
-    log.info('stations (#{}): {}'.format(
-        len(inv.station.unique()),
-        ','.join(list(inv.station.unique()))
-    ))
-    log.info('channels (#{}): {}'.format(
-        len(inv.channel.unique()),
-        ','.join(list(inv.channel.unique()))
-    ))
+    stations = inv.station.unique()
+    channels = inv.channel.unique()
+
+    log.info(f'stations (#{len(stations)}): {",".join(stations)}')
+    log.info(f'channels (#{len(channels)}): {",".join(channels)}')
 
     #
-    # sds availiability function
+    # sds day scan function
     #
-    def sds_availability(**kwargs):
+    def sds_day_scan(sr_map, qc, t0, t1):
+        """Scan the local SDS archive once for all stations and channels of
+        the day, reading the miniSEED headers only. A single pass over the
+        headers accumulates the number of samples per (station, channel)
+        within the day window and, if ``qc`` is enabled, verifies the
+        sampling rates against the inventory lookup ``sr_map``. Returns
+        the accumulated samples and the set of (station, channel) pairs
+        that deviate too much and need a new request.
         """
-        """
-        avail = sds_client.get_availability_percentage(**kwargs)
+        filenames = set()
 
-        return avail[0]
+        for sta, cha in sr_map:
+            filenames |= set(sds_client._get_filenames(
+                network='IM', station=sta, location='', channel=cha,
+                starttime=t0, endtime=t1 - 1.,
+            ))
 
-    #
-    # sds qc function
-    #
-    def verify_sds_sampling_rate(sampling_rate, **kwargs):
-        """
-        """
-        st = sds_client.get_waveforms(**kwargs)
+        st = Stream()
+
+        for filename in filenames:
+            try:
+                st += read(filename, format='MSEED', headonly=True)
+            except Exception:
+                continue
 
-        inconsistency = False
+        npts = defaultdict(int)
+        fix_keys = set()
+        renew = set()
+        warned = set()
 
         for tr in st:
 
+            key = (tr.stats.station, tr.stats.channel)
+
+            # samples within the day window only
+            overlap = (min(tr.stats.endtime, t1 - tr.stats.delta) -
+                       max(tr.stats.starttime, t0))
+
+            if overlap >= 0.:
+                npts[key] += int(round(overlap * tr.stats.sampling_rate)) + 1
+
+            if not qc:
+                continue
+
+            sampling_rate = sr_map.get(key)
+
+            if sampling_rate is None:
+                continue
+
             sampling_error = abs(tr.stats.sampling_rate - sampling_rate)
 
             if sampling_error > 0.:
 
-                if not inconsistency:
+                if key not in warned:
                     log.warning(
-                        '{} sample rate {:.3f} in archive inconsistent with '
-                        'vdms inventory sample rate {:.3f}.'
-                        .format(tr.stats.id, tr.stats.sampling_rate,
-                                sampling_rate)
+                        f'{tr.stats.id} sample rate '
+                        f'{tr.stats.sampling_rate:.3f} in archive '
+                        'inconsistent with vdms inventory sample rate '
+                        f'{sampling_rate:.3f}.'
                     )
+                    warned.add(key)
 
                 if sampling_error > 1e-2:
-                    raise RequestItem
+                    renew.add(key)
+                else:
+                    fix_keys.add(key)
+
+        # only the few traces that need a rate fix are actually loaded
+        if fix_keys:
+
+            fix = Stream()
+
+            for sta, cha in fix_keys:
+                st = sds_client.get_waveforms(
+                    network='IM', station=sta, location='', channel=cha,
+                    starttime=t0, endtime=t1,
+                )
+                for tr in st:
+                    tr.stats.sampling_rate = sr_map[(sta, cha)]
+                fix += st
+
+            stream2SDS(fix, sds_root, method='overwrite', verbose=False)
+
+        return npts, renew
+
+    #
+    # channel status function, memoized per station prefix and day so
+    # repeated queries are served from memory instead of a new submission
+    #
+    @lru_cache(maxsize=64)
+    def channel_status(prefix: str, day_iso: str):
+        """Request the channel status for a station prefix and day.
+        """
+        nonlocal request_size
+
+        misses = _fetch_chan_status.cache_info().misses
+        status, size_bytes = _fetch_chan_status(prefix, day_iso)
+
+        # only meter traffic that actually went over the wire
+        if _fetch_chan_status.cache_info().misses != misses:
+            request_size += size_bytes
+
+        return status
+
+    #
+    # sds day verify function
+    #
+    def sds_day_verify(i: int):
+        """Slice the inventory for day ``i`` and scan the local archive.
+        Returns the day inventory, the accumulated samples per
+        (station, channel) and the pairs flagged by the qc.
+        """
+        day = days[i]
+        day_inv = inv[(inv_on <= day) & (inv_off > day)]
+
+        if day_inv.empty:
+            return day_inv, {}, set()
+
+        t0 = UTCDateTime(day_stamps[i])
+
+        sr_map = dict(zip(zip(day_inv.station, day_inv.channel),
+                          day_inv.sampling_rate))
+
+        day_npts, renew = sds_day_scan(sr_map, sds_qc, t0, t0 + 86400)
+
+        return day_inv, day_npts, renew
 
-                tr.stats.sampling_rate = sampling_rate
-                inconsistency = True
+    # convert the inventory epochs once so the per-day filter is a plain
+    # vectorized datetime64 comparison
+    inv_on = pd.to_datetime(inv.on_date)
+    inv_off = pd.to_datetime(inv.off_date).fillna(pd.Timestamp.max)
 
-        if inconsistency:
-            stream2SDS(st, sds_root, method='overwrite', verbose=False)
+    # precompute the per-day date and julian day strings (vectorized strftime)
+    # and the day-aligned POSIX timestamps
+    tstrs = days.strftime('%Y-%m-%d')
+    jstrs = days.strftime('%j')
+    day_stamps = (days - pd.Timestamp(0)).total_seconds()
+
+    # archive scans are prefetched one day ahead, overlapping the local
+    # disk I/O with the network requests of the current day
+    executor = ThreadPoolExecutor(max_workers=1)
+    scan = executor.submit(sds_day_verify, 0)
 
     try:
 
         # evaluate per day
-        for day in days:
+        for i, (day, tstr, jstr) in enumerate(zip(days, tstrs, jstrs)):
 
             # check limit
             if request_limit and request_size >= request_limit:
                 break
 
-            # get start and end time
-            t0 = UTCDateTime(day)
-            t1 = t0 + 86400
+            # get the (prefetched) archive scan for the day
+            day_inv, day_npts, renew = scan.result()
 
-            # construct base argument dictionary
-            day_args = dict(network='IM', location='',
-                            starttime=t0, endtime=t1)
+            # prefetch the archive scan of the next day
+            if i + 1 < len(days):
+                scan = executor.submit(sds_day_verify, i + 1)
 
             # user feedback
             log.info('')
-            log.heading('Verify sds archive for {} (day {})'.format(
-                day.strftime('%Y-%m-%d'), day.strftime('%j')), 2
-            )
+            log.heading(f'Verify sds archive for {tstr} (day {jstr})', 2)
 
             # init day variables
             day_status = None
             day_status_requested = False
-            missing_items = []
+            day_samples = {}
+            missing_stations = set()
+            missing_channels = set()
 
-            # slice inventory for day
-            day_inv = inv[(inv.on_date <= day) &
-                          ((inv.off_date > day) | (inv.off_date.isnull()))]
+            if day_inv.empty:
+                log.info('Nothing to verify for this day.')
+                continue
 
-            # loop over items in day inventory
-            for item in day_inv.itertuples():
+            def item_missing(item) -> bool:
+                """Returns `True` if the item should be (re)requested.
+                """
+                nonlocal day_status, day_status_requested, day_samples
 
-                # catch SkipItem, RequestItem, and any other error
-                try:
+                # request if the archived sampling rate was rejected
+                if (item.station, item.channel) in renew:
+                    return True
 
-                    # construct stream argument dictionary
-                    sds_args = dict(**day_args, station=item.station,
-                                    channel=item.channel)
+                # get availability
+                sds_sec = (day_npts[(item.station, item.channel)] /
+                           item.sampling_rate)
+                sds_avail = sds_sec / 86400.
 
-                    # extra analysis if data availability
-                    if sds_qc:
-                        verify_sds_sampling_rate(item.sampling_rate,
-                                                 **sds_args)
+                log.info(
+                    f'{item.station}.{item.channel} @ sds  '
+                    f'{sds_avail*100:6.2f}% ({86400-sds_sec:.2f}s)'
+                )
 
-                    # get availability
-                    sds_avail = sds_availability(**sds_args)
-                    sds_sec = sds_avail * 86400.
+                # go to next item if 100%
+                if sds_avail >= 1:
+                    return False
 
-                    log.info(
-                        f'{item.station}.{item.channel} @ sds  '
-                        f'{sds_avail*100:6.2f}% ({86400-sds_sec:.2f}s)'
-                    )
+                # direct request if no data availability
+                if not sds_avail > 0:
+                    return True
 
-                    # go to next item if 100%
-                    if sds_avail == 1:
-                        raise SkipItem
+                # get availability
+                if not day_status_requested:
 
-                    # direct request if no data availability
-                    if not sds_avail > 0:
-                        raise RequestItem
+                    log.info('Request status for day.')
 
-                    # get availability
-                    if not day_status_requested:
+                    day_status_requested = True
 
-                        log.info('Request status for day.')
+                    day_status = channel_status(
+                        item.station[0:3] + '*', tstr
+                    )
 
-                        day_status_requested = True
+                    if isinstance(day_status, pd.DataFrame):
 
-                        request.message = Chan_status(
-                            station=item.station[0:3] + '*',
-                            channel='*',
-                            starttime=day,
+                        # aggregate the reported samples once per day
+                        day_samples = (
+                            day_status[day_status.samples > 0]
+                            .groupby(['station', 'channel'])
+                            .samples.sum().to_dict()
                         )
 
-                        day_status = request.submit()
-
-                        request_size += request.size_bytes
-
-                        if not isinstance(day_status, pd.DataFrame):
-
-                            log.warning('Status request returned None.')
-                            log.info('All waveforms for this day shall be '
-                                     'requested if threshold is exceeded.')
+                    else:
 
-                    if isinstance(day_status, pd.DataFrame):
+                        log.warning('Status request returned None.')
+                        log.info('All waveforms for this day shall be '
+                                 'requested if threshold is exceeded.')
 
-                        status = day_status.loc[
-                            (day_status.station == item.station) &
-                            (day_status.channel == item.channel)
-                        ]
+                if isinstance(day_status, pd.DataFrame):
 
-                        vdms_sec = (status[['samples']].sum().values[0] /
-                                    item.sampling_rate)
-                        vdms_avail = vdms_sec / 86400
+                    vdms_sec = (
+                        day_samples.get((item.station, item.channel), 0) /
+                        item.sampling_rate
+                    )
+                    vdms_avail = vdms_sec / 86400
 
-                        log.debug(
-                            f'{item.station}.{item.channel} @ vdms '
-                            f'{vdms_avail*100:6.2f}% ({86400-vdms_sec:.2f}s)'
-                        )
+                    log.debug(
+                        f'{item.station}.{item.channel} @ vdms '
+                        f'{vdms_avail*100:6.2f}% ({86400-vdms_sec:.2f}s)'
+                    )
 
-                        if vdms_sec - sds_sec >= threshold:
-                            raise RequestItem
+                    return vdms_sec - sds_sec >= threshold
 
-                    elif 86400 - sds_sec >= threshold:
-                        raise RequestItem
+                return 86400 - sds_sec >= threshold
 
-                except SkipItem:
-                    continue
+            # loop over items in day inventory
+            for item in day_inv.itertuples():
 
-                except RequestItem:
-                    missing_items.append(item)
-                    continue
+                if item_missing(item):
+                    missing_stations.add(item.station)
+                    missing_channels.add(item.channel)
 
             # Request missing items for day?
-            if len(missing_items) == 0:
+            if not missing_stations:
                 log.info('Nothing to add for this day.')
                 continue
 
-            stats = ','.join(set([item.station for item in missing_items]))
-            chans = ','.join(set([item.channel for item in missing_items]))
+            # re-check the limit mid-day: the status requests above also
+            # count towards the total request size
+            if request_limit and request_size >= request_limit:
+                break
+
+            stats = ','.join(sorted(missing_stations))
+            chans = ','.join(sorted(missing_channels))
 
             log.info('Request missing data:')
             log.info(f'       station = {stats}')
@@ -340,13 +480,15 @@ def waveforms2SDS(
             request.message = Waveform(station=stats, channel=chans,
                                        starttime=day)
 
-            log.debug('Waveform request message:')
-            log.debug(str(request.message))
+            if log.debug_enabled:
+                log.debug('Waveform request message:')
+                log.debug(str(request.message))
 
             st = request.submit()
 
-            log.debug('Got an answer.\nThis is the summary:')
-            log.debug(str(request))
+            if log.debug_enabled:
+                log.debug('Got an answer.\nThis is the summary:')
+                log.debug(str(request))
 
             request_size += request.size_bytes
 
@@ -381,6 +523,10 @@ def waveforms2SDS(
 
         return Response(success=False, time=day, size_bytes=request_size)
 
+    finally:
+
+        executor.shutdown(wait=False)
+
     # Completed
     log.heading('Waveforms2SDS terminated', 1)
 
@@ -397,94 +543,40 @@ def waveforms2SDS(
     return response
 
 
-class SkipItem(Exception):
-    pass
-
-
-class RequestItem(Exception):
-    pass
-
-
-class Response(object):
+@dataclass(frozen=True)
+class Response:
     """
-    Create a new request response object.
+    Immutable request response object with a summary.
 
-    For details see the :meth:`Response.__init__()`
-    method.
-    """
-
-    def __init__(
-        self, success: bool = False, error: str = None,
-        time: pd.Timestamp = None, size_bytes: int = None,
-        quota_exceeded: bool = False
-    ):
-        """
-        Initializes a Client response object.
-
-        >>> response = ClientResponse()
+    >>> response = Response(success=True, size_bytes=1024)
 
-        """
-        self._success = success or False
-        self._error = error or None
-        self._time = time or None
-        self._num_bytes = size_bytes or None
-        self._quota_exceeded = quota_exceeded or False
-
-    @property
-    def success(self):
-        """
-        Return the response success status.
-        """
-        return self._success
-
-    @property
-    def error(self):
-        """
-        Return the error.
-        """
-        return self._error
+    """
+    success: bool = False
+    error: str = None
+    time: pd.Timestamp = None
+    size_bytes: int = None
+    quota_exceeded: bool = False
 
     @property
     def completed(self):
         """
         Return if the response is completed.
         """
-        return self._time is None
-
-    @property
-    def time(self):
-        """
-        Return the response time if not completed.
-        """
-        return self._time
-
-    @property
-    def size_bytes(self):
-        """
-        Return the total response size in bytes.
-        """
-        return self._num_bytes
+        return self.time is None
 
     @property
     def size(self):
         """
         Return the total response size human readable.
         """
-        return format_size(self._num_bytes) if self._num_bytes else 'nothing'
-
-    @property
-    def quota_exceeded(self):
-        """
-        Return if the daily quota limit was reached.
-        """
-        return self._quota_exceeded
+        return format_size(self.size_bytes) if self.size_bytes else 'nothing'
 
     @property
     def quota_remaining(self):
         """
         Return if the daily quota limit was not yet reached.
         """
-        return (not self._quota_exceeded)
+        return (not self.quota_exceeded)
 
     @property
     def status(self):
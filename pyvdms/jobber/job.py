@@ -1,21 +1,21 @@
 
 
 # Mandatory imports
-import pandas as pd
 from obspy import UTCDateTime
-from secrets import token_hex
+from secrets import choice, SystemRandom
 import sys
 import os
 import json
 import getpass
 from humanfriendly import format_size, parse_size
-from tabulate import tabulate
 
 
 # Relative imports
 from ..util.time import to_datetime, set_time_range
-from ..vdms import Client
-from ..filesystem import waveforms2SDS
+
+# Deferred imports: pandas, ..vdms.Client and
+# ..filesystem.waveforms2SDS are imported at their call sites so that
+# queue bookkeeping does not pay their import cost up front.
 
 
 __all__ = ['Job']
@@ -31,6 +31,30 @@ _status_codes = {
     'JOB_COMPLETED': 'Completed'
 }
 
+_status_codes_lower = {key: val.lower() for key, val in _status_codes.items()}
+
+_terminal_statuses = frozenset(
+    ('JOB_ERROR', 'JOB_CANCELLED', 'JOB_COMPLETED')
+)
+
+_hex_digits = '0123456789abcdef'
+_hex_alpha = 'abcdef'
+
+shuffle = SystemRandom().shuffle
+
+_shared_client = None
+
+
+def _get_client():
+    """Get the module-wide VDMS client, shared by all jobs in the
+    process instead of constructing one per validation.
+    """
+    global _shared_client
+    if _shared_client is None:
+        from ..vdms import Client
+        _shared_client = Client()
+    return _shared_client
+
 
 class Job(object):
     """
@@ -39,6 +63,13 @@ class Job(object):
     For details see the :meth:`~jobber.jobber.Job.__init__()` method.
     """
 
+    __slots__ = (
+        '_id', '_t0', '_t1', '_t', '_station', '_channel', '_sds_root',
+        '_priority', '_request_limit', '_request_limit_str', '_user',
+        '_client', '_client_kwargs', '_status', '_status_set',
+        '_is_terminal', '_check_pending', '_dict_cache',
+    )
+
     def __init__(
         self, sds_root: str, station: str, channel: str, starttime,
         endtime=None, priority: int = None, request_limit=None,
@@ -89,6 +120,9 @@ class Job(object):
         Any additional keyword arguments will be passed to the request service.
         """
 
+        # to_dict cache, invalidated by the mutating methods
+        self._dict_cache = None
+
         # set sds root
         if not isinstance(sds_root, str):
             raise TypeError('sds_root should be of type `str`.')
@@ -133,12 +167,15 @@ class Job(object):
         else:
             self._client_kwargs = kwargs
 
-        # set status
+        # set status, with a parallel set for O(1) membership tests
         self._status = status or []
+        self._status_set = {s[1] for s in self._status}
+        self._is_terminal = not _terminal_statuses.isdisjoint(self._status_set)
         if not self._status:
             self._set_status('JOB_PENDING')
-        if not self._has_status(['JOB_READY']):
-            self._check()
+
+        # defer the validity check until the job is actually needed
+        self._check_pending = 'JOB_READY' not in self._status_set
 
     def __str__(self):
         """Get the JSON formatted job.
@@ -158,7 +195,12 @@ class Job(object):
             table += [('-'*27, '-'*20)]
             table += self.history
 
-        return tabulate(table)
+        width = max(len(str(key)) for key, val in table)
+
+        return '\n'.join(
+            f'{key:<{width}}  {"" if val is None else val}'.rstrip()
+            for key, val in table
+        )
 
     @property
     def id(self):
@@ -218,6 +260,7 @@ class Job(object):
             raise TypeError('priority should be of type `int`.')
 
         self._priority = priority
+        self._dict_cache = None
 
     @property
     def request_limit_bytes(self):
@@ -229,8 +272,7 @@ class Job(object):
     def request_limit(self):
         """Get the human readable Job request limit.
         """
-        return (format_size(self._request_limit) if self._request_limit > 0
-                else None)
+        return self._request_limit_str
 
     @request_limit.setter
     def request_limit(self, request_limit):
@@ -245,6 +287,11 @@ class Job(object):
         else:
             raise TypeError('Request limit should be of type int or str.')
 
+        # format once on set; the property is hit per to_dict and print
+        self._request_limit_str = (format_size(self._request_limit)
+                                   if self._request_limit > 0 else None)
+        self._dict_cache = None
+
     @property
     def client(self):
         """Get the job client.
@@ -283,25 +330,30 @@ class Job(object):
     def _has_statuscode(self, statuslist):
         """Check if the job contains a certain status code.
         """
-        return self.statuscode.lower() in statuslist if statuslist else True
+        if not statuslist:
+            return True
+        return _status_codes_lower[self._status[-1][1]] in statuslist
 
     @property
     def ready(self):
-        """Returns `True` if the job is ready.
+        """Returns `True` if the job is ready. Triggers the deferred
+        validity check on first access.
         """
-        return self._has_status(['JOB_READY'])
+        if self._check_pending:
+            self.check()
+        return 'JOB_READY' in self._status_set
 
     @property
     def completed(self):
         """Returns `True` if the job is completed.
         """
-        return self._has_status(['JOB_COMPLETED'])
+        return 'JOB_COMPLETED' in self._status_set
 
     @property
     def error(self):
         """Returns `True` if the job has an error.
         """
-        return self._has_status(['JOB_ERROR'])
+        return 'JOB_ERROR' in self._status_set
 
     @property
     def scheduled(self):
@@ -325,10 +377,9 @@ class Job(object):
         """
         if not statuslist:
             return False
-        for status in self._status:
-            if status[1] in statuslist:
-                return True
-        return False
+        if len(statuslist) == 1:
+            return statuslist[0] in self._status_set
+        return not self._status_set.isdisjoint(statuslist)
 
     @property
     def history(self):
@@ -353,18 +404,27 @@ class Job(object):
             self._set_status('JOB_ERROR')
             return
         self._t = time
+        self._dict_cache = None
         self.schedule()
 
+    def check(self):
+        """Verify the job validity, deferred from construction.
+        """
+        self._check_pending = False
+        self._check()
+
     def _check(self):
         """Verify the job validity.
         """
+        import pandas as pd
+
         self._set_status('JOB_CHECK')
         if not os.path.isdir(self._sds_root):
             print("SDS root path\"{}\" does not exist.".format(self._sds_root))
             self._set_status('JOB_ERROR')
             return
         try:
-            client = Client()
+            client = _get_client()
             inventory = client.get_channels(
                 station=self._station,
                 channel=self._channel,
@@ -386,6 +446,10 @@ class Job(object):
     def process(self, update_status: bool = True, **kwargs):
         """Process the job.
         """
+        from ..filesystem import waveforms2SDS
+
+        if self._check_pending:
+            self.check()
         try:
             self._t = self._t or self._t0
             if update_status:
@@ -429,14 +493,18 @@ class Job(object):
     def is_active(self):
         """Returns `True` if the job is active.
         """
-        return not self._has_status(['JOB_ERROR', 'JOB_CANCELLED',
-                                     'JOB_COMPLETED'])
+        return not self._is_terminal
 
-    def _set_status(self, status: str):
-        """Set the job status.
+    def _set_status(self, status: str, time: str = None):
+        """Set the job status, optionally re-using a timestamp shared
+        across a batch of status transitions.
         """
         if status in _status_codes:
-            self._status.append((str(UTCDateTime()), status))
+            self._status.append((time or str(UTCDateTime()), status))
+            self._status_set.add(status)
+            self._is_terminal = (self._is_terminal or
+                                 status in _terminal_statuses)
+            self._dict_cache = None
         else:
             raise ValueError('Illegal status "{}"'.format(status))
 
@@ -452,32 +520,35 @@ class Job(object):
     def to_dict(self, keys: list = None, pop: list = None) -> dict:
         """Convert Job to a dictionary.
         """
-        d = dict(
-            id=self.id,
-            starttime=self.starttime.strftime('%Y-%m-%d'),
-            endtime=self.endtime.strftime('%Y-%m-%d'),
-            time=self.time.strftime('%Y-%m-%d') if self.time else None,
-            station=self.station,
-            channel=self.channel,
-            sds_root=self.sds_root,
-            priority=self.priority,
-            request_limit=self.request_limit,
-            user=self.user,
-            client=self.client,
-            client_kwargs=self._client_kwargs,
-            status=self._status,
-        )
+        if self._dict_cache is None:
+            self._dict_cache = dict(
+                id=self.id,
+                starttime=self.starttime.strftime('%Y-%m-%d'),
+                endtime=self.endtime.strftime('%Y-%m-%d'),
+                time=self.time.strftime('%Y-%m-%d') if self.time else None,
+                station=self.station,
+                channel=self.channel,
+                sds_root=self.sds_root,
+                priority=self.priority,
+                request_limit=self.request_limit,
+                user=self.user,
+                client=self.client,
+                client_kwargs=self._client_kwargs,
+                status=self._status,
+            )
+        cache = self._dict_cache
         if keys:
             if 'id' in keys:
                 keys.remove('id')
             keys.insert(0, 'id')
-            d = {key: d[key] for key in keys}
-            if 'status' in keys:
+            d = {key: cache[key] for key in keys}
+            if 'status' in d:
                 d['status'] = _status_codes[d['status'][-1][1]]
-        elif pop:
-            for item in pop:
-                d.pop(item, None)
-        return d
+            return d
+        if pop:
+            return {key: val for key, val in cache.items()
+                    if key not in pop}
+        return dict(cache)
 
     def to_json(self):
         """Convert Job to json.
@@ -491,12 +562,10 @@ def token(n: int = 5, min_alpha: int = 2):
     """
 
     # avoid numeric tokens with only e -> require 2 or more characters.
-    while True:
-
-        t = token_hex(n)
-
-        if sum(c.isalpha() for c in t) >= min_alpha:
-
-            break
+    # draw the guaranteed alpha characters explicitly instead of
+    # rejection-sampling token_hex until enough show up
+    chars = [choice(_hex_alpha) for _ in range(min_alpha)]
+    chars += [choice(_hex_digits) for _ in range(2 * n - min_alpha)]
+    shuffle(chars)
 
-    return t
+    return ''.join(chars)
@@ -1,11 +1,12 @@
 
 
 # Mandatory imports
-from hashlib import sha256
+from bisect import bisect_right
+from hashlib import blake2b, sha256
+from operator import attrgetter, itemgetter
 import os
 import json
 from warnings import warn
-from tabulate import tabulate
 
 
 # Relative imports
@@ -27,16 +28,60 @@ _tabulate_keys = {
     'user': 'user',
 }
 
+# row extractor and header labels of the queue overview, built once
+_row_getter = itemgetter(*_tabulate_keys)
+_tabulate_headers = tuple(_tabulate_keys.values())
+
+
+def _format_table(table: list, headers: tuple) -> str:
+    """Format the queue overview in tabulate's simple style with a
+    single width pass instead of a full tabulate run per print.
+    """
+    rows = [tuple('' if val is None else str(val) for val in row)
+            for row in table]
+    numeric = [all(isinstance(row[i], int) for row in table)
+               for i in range(len(headers))]
+    # headers get two padding columns, as in tabulate's simple format
+    widths = [max(len(header) + 2, max(len(row[i]) for row in rows))
+              for i, header in enumerate(headers)]
+
+    def fmt(cells):
+        return '  '.join(
+            cell.rjust(widths[i]) if numeric[i] else cell.ljust(widths[i])
+            for i, cell in enumerate(cells)
+        ).rstrip()
+
+    lines = [fmt(headers), '  '.join('-' * width for width in widths)]
+    lines += [fmt(row) for row in rows]
+
+    return '\n'.join(lines)
+
+
+# encoders reused across all queue JSON paths instead of constructing
+# one per json.dump(s) call
+_compact_encoder = json.JSONEncoder(separators=(',', ':'), sort_keys=True)
+_pretty_encoder = json.JSONEncoder(indent=4)
+
+# content hash constructors: blake2b for new lockfiles, sha256 to
+# verify lockfiles written by earlier releases
+_hash_algos = {'blake2b': blake2b, 'sha256': sha256}
+
 
 class Queue(object):
     """
     """
+
+    __slots__ = ('_lock', '_cron', 'jobs', '_index', '_keys', '_written')
+
     def __init__(self, json_lock: str = None):
         """
         """
         self._lock = json_lock
         self._cron = None
         self.jobs = []
+        self._index = {}
+        self._keys = []
+        self._written = None
         if json_lock:
             self.read_lock(json_lock)
 
@@ -64,32 +109,29 @@ class Queue(object):
         """Return the jobs in the queue, optionally filtered for
         a user and/or status.
         """
-        return list(filter(
-            lambda job: job._has_statuscode(status) and job._has_user(user),
-            self.jobs
-        ))
+        # normalize once so the per-job predicates probe a set
+        user = frozenset(user) if user else None
+        status = frozenset(status) if status else None
+        return [job for job in self.jobs
+                if job._has_statuscode(status) and job._has_user(user)]
 
     def index(self, status: str = None, user: str = None):
         """Print the queue overview, optionally filter for a user or status.
         """
-        table = []
         jobs = self.jobs_to_dict(keys=list(_tabulate_keys.keys()),
                                  status=status, user=user)
 
         if not jobs:
             return 'No jobs found.'
 
-        for job in jobs:
-            table.append(list(job[key] for key in _tabulate_keys))
+        table = [_row_getter(job) for job in jobs]
 
-        return tabulate(
-            table, headers=list(val for key, val in _tabulate_keys.items())
-        )
+        return _format_table(table, _tabulate_headers)
 
     def next(self):
         """Return the next job to process in the queue.
         """
-        return self.scheduled()[0] if self.scheduled() else None
+        return next((job for job in self.jobs if job.scheduled), None)
 
     @property
     def crontab(self):
@@ -108,21 +150,43 @@ class Queue(object):
     def add(self, job: Job):
         """Add a job to the queue.
         """
+        if not self._admit(job):
+            return
+
+        # insert at the sorted position (descending priority, FIFO for
+        # equal priorities) instead of re-sorting the full list
+        idx = bisect_right(self._keys, -job.priority)
+        self._keys.insert(idx, -job.priority)
+        self.jobs.insert(idx, job)
+        self._index[job.id] = job
+
+    def _admit(self, job: Job) -> bool:
+        """Validate and schedule a job before it enters the queue.
+        """
         if not isinstance(job, Job):
             raise TypeError('job should be a Job object.')
 
-        if isinstance(self.find(job), Job):
+        if job.id in self._index:
             warn(f'Job {job.id} already exists. Skipped.')
-            return
+            return False
 
-        if not job._has_status(['JOB_READY']):
+        if not job.ready:
             warn(f'Job {job.id} is not ready. Skipped.')
-            return
+            return False
 
-        if not job._has_status(['JOB_SCHEDULED']):
+        if 'JOB_SCHEDULED' not in job._status_set:
             job._set_status('JOB_SCHEDULED')
 
-        self.jobs.append(job)
+        return True
+
+    def _bulk_add(self, jobs):
+        """Add many jobs at once, deferring the sort until the end
+        instead of bisecting per insertion.
+        """
+        for job in jobs:
+            if self._admit(job):
+                self.jobs.append(job)
+                self._index[job.id] = job
         self.sort()
 
     def remove(self, job):
@@ -136,24 +200,27 @@ class Queue(object):
             raise TypeError('job should be of type `str` or a Job object.')
 
         if job in self.jobs:
+            del self._keys[self.jobs.index(job)]
             self.jobs.remove(job)
+            self._index.pop(job.id, None)
         else:
             warn('Job not in queue: ignored.')
 
     def find(self, id: str):
         """Find a job in the queue by its id.
         """
-        for job in self.jobs:
-            if job.id == id:
-                return job
-        return None
+        return self._index.get(id)
 
     def sort(self):
         """Sort the queue on the job priority (descending).
+
+        The queue is kept sorted on insertion; call this after changing
+        the priority of an already queued job.
         """
-        self.jobs = sorted(
-            self.jobs, key=lambda job: int(job.priority), reverse=True
-        )
+        # the priority setter guarantees an int, so sort on the raw
+        # attribute without per-comparison int() coercion
+        self.jobs.sort(key=attrgetter('priority'), reverse=True)
+        self._keys = [-job.priority for job in self.jobs]
 
     def process(self, **kwargs):
         """Process the queue until completed or paused.
@@ -182,60 +249,97 @@ class Queue(object):
         """
         with open(json_file) as file:
             jsonjobs = json.load(file)
-            for jj in jsonjobs:
-                self.add(Job(**jj))
+            self._bulk_add(Job(**jj) for jj in jsonjobs)
 
-    def _hash(self, jobs: list = None):
+    def _hash(self, jobs: list = None, algo: str = 'blake2b'):
         """Hash the queue.
         """
-        hash_obj = sha256(
-            str(
-                json.dumps(jobs or self.jobs_to_dict(), indent=4)
-            ).encode('ascii')
-        )
+        if jobs is None:
+            jobs = self.jobs_to_dict()
+        hash_obj = _hash_algos[algo]()
+        for chunk in _compact_encoder.iterencode(jobs):
+            hash_obj.update(chunk.encode())
         return hash_obj.hexdigest()
 
+    def _hash_legacy(self, jobs: list):
+        """Hash the queue as written by lockfiles predating the compact
+        serialization of :meth:`_hash`.
+        """
+        return sha256(json.dumps(jobs, indent=4).encode('ascii')).hexdigest()
+
     def jobs_to_dict(self, user=None, status=None, **kwargs) -> list:
         """Convert the queued jobs to a list of dictionaries.
         """
-        return [job.to_dict(**kwargs)
-                for job in self.items(user=user, status=status)]
+        user = frozenset(user) if user else None
+        status = frozenset(status) if status else None
+        return [job.to_dict(**kwargs) for job in self.jobs
+                if job._has_statuscode(status) and job._has_user(user)]
 
     def to_dict(self, **kwargs) -> list:
         """Convert the queued jobs and queue parameters to a list of
         dictionaries.
         """
+        jobs = self.jobs_to_dict(**kwargs)
         return dict(
             _readme=('This file locks the jobs to a known state. '
                      'This file is @generated automatically. '
                      'Do not modify!'),
             crontab=self._cron,
-            content_hash=self._hash(),
-            jobs=self.jobs_to_dict(**kwargs)
+            hash_algo='blake2b',
+            content_hash=self._hash(jobs),
+            jobs=jobs
         )
 
     def write_lock(self, json_file: str = None):
         """Write the locked queue to a JSON file.
+
+        Writing is skipped when neither the jobs nor the crontab
+        changed since the last write of the queue's own lockfile.
         """
-        with open(json_file or self._lock, 'w') as file:
-            json.dump(self.to_dict(), file, indent=4)
+        state = self.to_dict()
+        written = (state['content_hash'], self._cron)
+
+        if json_file is None and written == self._written:
+            return
+
+        # write to a sibling tempfile and publish atomically so readers
+        # never observe a partially written lockfile
+        target = json_file or self._lock
+        tmp = target + '.tmp'
+        with open(tmp, 'w') as file:
+            for chunk in _pretty_encoder.iterencode(state):
+                file.write(chunk)
+        os.replace(tmp, target)
+
+        if json_file is None or json_file == self._lock:
+            self._written = written
 
     def read_lock(self, json_file: str = None):
         """Read the locked queue to a JSON file.
         """
         self.jobs = []
+        self._index = {}
+        self._keys = []
         self._cron = None
+        self._written = None
         if not os.path.isfile(json_file or self._lock):
             return
         with open(json_file or self._lock) as file:
             jsonjobs = json.load(file)
-            if jsonjobs['content_hash'] != self._hash(jsonjobs['jobs']):
+            algo = jsonjobs.get('hash_algo', 'sha256')
+            hashes = (self._hash(jsonjobs['jobs'], algo),)
+            if algo == 'sha256':
+                hashes += (self._hash_legacy(jsonjobs['jobs']),)
+            if jsonjobs['content_hash'] not in hashes:
                 raise ValueError('Content hash does not comply with the '
                                  'lockfile. Did someone modify the lockfile?')
             if 'crontab' in jsonjobs:
                 self._cron = jsonjobs['crontab']
-            for jj in jsonjobs['jobs']:
-                self.add(Job(**jj))
+            self._bulk_add(Job(**jj) for jj in jsonjobs['jobs'])
+            # remember the on-disk state so an unchanged queue does not
+            # rewrite its own lockfile
+            if jsonjobs['content_hash'] == self._hash():
+                self._written = (jsonjobs['content_hash'], self._cron)
 
     def ids(self) -> list:
         """List the job ids in the queue.
@@ -245,9 +349,9 @@ class Queue(object):
     def scheduled(self) -> list:
         """List the scheduled jobs in the queue.
         """
-        return list(filter(lambda job: job.scheduled, self.jobs))
+        return [job for job in self.jobs if job.scheduled]
 
     def processing(self) -> list:
         """List the processing jobs in the queue.
         """
-        return list(filter(lambda job: job.processing, self.jobs))
+        return [job for job in self.jobs if job.processing]
@@ -22,6 +22,9 @@ __all__ = []
 
 __name__ = 'pyvdms-scheduler'
 
+# key/value separator of command line arguments, e.g. "priority:3"
+_arg_split = re.compile(r"[:=]")
+
 conf_keys = {
     'starttime': str,
     'endtime': str,
@@ -64,11 +67,20 @@ def version():
     print(__version__)
 
 
+_conf_cache = {}
+
+
 def parse_conf():
-    """Parse config file.
+    """Parse config file. The validated content is cached per file and
+    re-read only when the file changes on disk.
     """
-    if not os.path.isfile(conf):
+    try:
+        mtime = os.stat(conf).st_mtime_ns
+    except OSError:
         return dict()
+    cached = _conf_cache.get(conf)
+    if cached and cached[0] == mtime:
+        return dict(cached[1])
     try:
         with open(conf) as f:
             d = json.load(f)
@@ -83,7 +95,9 @@ def parse_conf():
         elif d[key] is not None and not isinstance(d[key], conf_keys[key]):
             print(f'Illegal conf value for key "{key}":"{d[key]}". Ignored.')
             del d[key]
-    return d
+    _conf_cache[conf] = (mtime, d)
+    # return a copy so callers can modify the defaults freely
+    return dict(d)
 
 
 def defaults():
@@ -126,7 +140,7 @@ def add():
     """
     d = parse_conf()
     for arg in params['args']:
-        key, value = re.split(r"[:=]", arg.rstrip(','))
+        key, value = _arg_split.split(arg.rstrip(','))
         d[key] = value
     try:
         job = Job(**d)
@@ -166,13 +180,10 @@ def cron_start(instant: bool = True):
         print('Crontab already exists.')
         return
     now = datetime.now()
+    opt = '--dir=' + params['homedir'] if params['homedir'] else ''
     cmd = (
-        "bash -c 'source $HOME/.bashrc; {cmd} cron:run {opt}' >> {log} 2>&1"
-        .format(
-            cmd=sys.argv[0],
-            log=log,
-            opt=('--dir=' + params['homedir']) if params['homedir'] else '',
-        )
+        f"bash -c 'source $HOME/.bashrc; {sys.argv[0]} cron:run {opt}'"
+        f" >> {log} 2>&1"
     )
     crontab = CronTab(user=True)
     cronjob = crontab.new(
@@ -280,9 +291,11 @@ def update():
         return
     d = dict()
     for arg in params['args']:
-        key, value = re.split(r"[:=]", arg.rstrip(','))
+        key, value = _arg_split.split(arg.rstrip(','))
         d[key] = value
     job.update(**d)
+    # a priority change invalidates the insertion order of the queue
+    queue.sort()
     print(job.details(history=False))
     queue.write_lock()
 
@@ -322,12 +335,7 @@ def init():
     global system, home, log, lock, conf, queue
     system = platform.system()
 
-    if params['homedir']:
-        home = params['homedir']
-    elif os.environ.get('PYVDMS_HOME'):
-        home = os.environ.get('PYVDMS_HOME')
-    else:
-        home = '~/.pyvdms'
+    home = params['homedir'] or os.environ.get('PYVDMS_HOME') or '~/.pyvdms'
 
     if not os.path.isdir(home):
         print(f'Cannot find the directory "{home}". '
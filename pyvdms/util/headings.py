@@ -15,6 +15,10 @@ Construct various headings following the Python’s Style Guide for documenting.
 """
 
 
+# Mandatory imports
+from functools import lru_cache
+
+
 __all__ = ['heading', 'hr']
 
 _heading_levels = ['part', 'chapter', 'section', 'subsection',
@@ -46,14 +50,16 @@ def heading(title: str, level, to_list: bool = False):
     else:
         raise TypeError('Level should be of type `int` or `str`!')
 
-    return eval(f'heading_{level}(title, to_list)')
+    return _heading_funcs[level](title, to_list)
 
 
+@lru_cache(maxsize=128)
 def hr(linelen: int = 65, sym: str = '*', fill: bool = None):
-    """Construct a horizontal line.
+    """Construct a horizontal line. Lines are cached, as the same
+    symbol and length combinations recur for every heading and log rule.
     """
     fill = fill or sym
-    return '{s}{f}{s}'.format(s=sym, f=''.join(fill*(linelen-2)))
+    return sym + fill * (linelen - 2) + sym
 
 
 def heading_part(title: str, to_list: bool = False):
@@ -98,3 +104,9 @@ def heading_paragraph(title: str, to_list: bool = False):
     """
     linelist = [title, hr(len(title), '"')]
     return linelist if to_list else '\n'.join(linelist)
+
+
+# dispatch table of :func:`heading`, mapping each level name to its
+# constructor
+_heading_funcs = {level: globals()[f'heading_{level}']
+                  for level in _heading_levels}
@@ -20,6 +20,27 @@ from ..util.headings import heading, hr
 __all__ = ['Logger']
 
 
+def _emit_multiline(handler, record):
+    """Emit a multi-line record as per-line formatted messages with a
+    single stream write and flush. Returns `False` for single-line
+    records, which follow the regular emit path.
+    """
+    if not isinstance(record.msg, str) or '\n' not in record.msg:
+        return False
+    try:
+        formatted = []
+        for line in record.msg.splitlines():
+            record.msg = line
+            formatted.append(handler.format(record))
+        handler.stream.write('\n'.join(formatted) + handler.terminator)
+        handler.flush()
+    except RecursionError:
+        raise
+    except Exception:
+        handler.handleError(record)
+    return True
+
+
 class StreamHandler(logging.StreamHandler):
     """
     """
@@ -27,12 +48,7 @@ class StreamHandler(logging.StreamHandler):
         super().__init__(arg)
 
     def emit(self, record):
-        if isinstance(record.msg, str):
-            messages = record.msg.split('\n')
-            for message in messages:
-                record.msg = message
-                super().emit(record)
-        else:
+        if not _emit_multiline(self, record):
             super().emit(record)
 
 
@@ -43,13 +59,10 @@ class FileHandler(logging.FileHandler):
         super().__init__(arg)
 
     def emit(self, record):
-        if isinstance(record.msg, str):
-            messages = record.msg.split('\n')
-            for message in messages:
-                record.msg = message
-                super().emit(record)
-        else:
-            super().emit(record)
+        if self.stream is None:
+            self.stream = self._open()
+        if not _emit_multiline(self, record):
+            logging.StreamHandler.emit(self, record)
 
 
 class Logger(logging.Logger):
@@ -105,6 +118,18 @@ class Logger(logging.Logger):
 
         self.addHandler(handler)
 
+    @property
+    def verbose_enabled(self):
+        """Returns `True` if info logs are emitted.
+        """
+        return self.isEnabledFor(logging.INFO)
+
+    @property
+    def debug_enabled(self):
+        """Returns `True` if debug logs are emitted.
+        """
+        return self.isEnabledFor(logging.DEBUG)
+
     def heading(self, title: str, level):
         """Add a heading to the logs.
 
@@ -7,6 +7,10 @@ Common string list methods.
 
 """
 
+# Mandatory imports
+from itertools import islice
+
+
 __all__ = ['strlist_contains', 'strlist_extract']
 
 
@@ -15,10 +19,24 @@ def strlist_contains(lines, substr: str, case_sensitive: bool = True):
     Check if a string list contains a specific substr.
     """
 
-    sublist = strlist_extract(lines, substr, case_sensitive=case_sensitive,
-                              split=False, offset=0)
+    lines = lines or []
+
+    if not isinstance(lines, list):
+        raise TypeError('lines should be a list of strings.')
+
+    if not lines:
+        return False
 
-    return len(sublist) > 0
+    if not isinstance(substr, str):
+        raise TypeError('substr should be a string.')
+
+    # short-circuit at the first match instead of extracting all of them
+    if case_sensitive:
+        return any(substr in line for line in lines)
+
+    substr = substr.lower()
+
+    return any(substr in line.lower() for line in lines)
 
 
 def strlist_extract(lines, substr: str, split: bool = True,
@@ -52,20 +70,35 @@ def strlist_extract(lines, substr: str, split: bool = True,
     split = split if offset == 0 else False
 
     sublist = []
+    append = sublist.append
 
     first = -offset if offset < 0 else 0
     last = len(lines) - (offset if offset > 0 else 0)
 
-    if not case_sensitive:
-        substr = substr.lower()
+    # validate the scanned lines once instead of per loop iteration,
+    # viewing the window through islice rather than copying it out
+    if not all(isinstance(line, str)
+               for line in islice(lines, first, last)):
+        raise TypeError('lines should all be strings!')
+
+    # specialize the loop per case mode so the hot path tests membership
+    # without a per-line conditional
+    if case_sensitive:
 
-    for i, line in enumerate(lines[first:last], start=first):
+        for i, line in enumerate(islice(lines, first, last), start=first):
+
+            if substr in line:
+                append(line.split(substr, 1)[1].strip() if split
+                       else lines[i+offset])
+
+    else:
+
+        substr = substr.lower()
 
-        if not isinstance(line, str):
-            raise TypeError('lines should all be strings!')
+        for i, line in enumerate(islice(lines, first, last), start=first):
 
-        if substr in (line if case_sensitive else line.lower()):
-            sublist.append(line.split(substr, 1)[1].strip() if split
-                           else lines[i+offset])
+            if substr in line.lower():
+                append(line.split(substr, 1)[1].strip() if split
+                       else lines[i+offset])
 
     return sublist
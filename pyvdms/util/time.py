@@ -9,6 +9,7 @@ Common time methods.
 
 
 # Mandatory imports
+from datetime import datetime
 from pandas import to_datetime as pandas_to_datetime
 from pandas.tseries.offsets import DateOffset
 from dateparser import parse
@@ -17,6 +18,19 @@ from dateparser import parse
 __all__ = ['to_datetime', 'set_time_range']
 
 
+def _parse_str(time: str):
+    """Parse a datetime string. The strict ISO formats written by
+    :meth:`Job.to_dict` are short-circuited before falling back to the
+    full :meth:`dateparser.parse` pipeline.
+    """
+    for fmt in ('%Y-%m-%d', '%Y-%m-%d %H:%M:%S'):
+        try:
+            return datetime.strptime(time, fmt)
+        except ValueError:
+            pass
+    return parse(time)
+
+
 def to_datetime(time):
     r"""Extends :meth:`pandas.to_datetime` with some more date time format
     conversions.
@@ -36,11 +50,13 @@ def to_datetime(time):
     if time is None:
         return
 
-    if isinstance(time, object) and hasattr(time, 'datetime'):
+    # datetime-wrapping objects such as obspy.UTCDateTime expose the
+    # underlying datetime; try the attribute instead of probing for it
+    try:
         time = time.datetime
-
-    elif isinstance(time, str):
-        time = parse(time)
+    except AttributeError:
+        if isinstance(time, str):
+            time = _parse_str(time)
 
     return pandas_to_datetime(time)
 
@@ -9,6 +9,7 @@ Some general XML helper utilities.
 
 
 # Mandatory imports
+from functools import lru_cache
 from xml.dom.minidom import Document
 import re
 
@@ -16,6 +17,14 @@ import re
 __all__ = ['removeElementByTagName', 'removeElementAttribute']
 
 
+@lru_cache(maxsize=128)
+def _compile(regex: str):
+    """Compile a regex pattern, cached across calls since the same
+    filter patterns recur for every message.
+    """
+    return re.compile(regex)
+
+
 def removeElementByTagName(xmldoc: Document, tag: str, attr: str = None,
                            regex: str = None, invert: bool = False):
     """Remove an xml element by its tag name, attribute and values.
@@ -36,27 +45,17 @@ def removeElementByTagName(xmldoc: Document, tag: str, attr: str = None,
         if not isinstance(regex, str):
             raise TypeError('Regex should be of type str!')
 
-        r = re.compile(regex)
-
-        for node in nodes:
-
-            if not node.hasAttribute(attr):
+        r = _compile(regex)
 
-                continue
+        # collect the matches first, then prune, so the tree is not
+        # modified while it is being filtered
+        nodes = [node for node in nodes
+                 if node.hasAttribute(attr) and
+                 bool(r.match(node.getAttribute(attr))) is not invert]
 
-            if bool(r.match(node.getAttribute(attr))) is invert:
-
-                continue
-
-            parent = node.parentNode
-            parent.removeChild(node)
-
-    else:
-
-        for node in nodes:
+    for node in nodes:
 
-            parent = node.parentNode
-            parent.removeChild(node)
+        node.parentNode.removeChild(node)
 
 
 def removeElementAttribute(xmldoc: Document, tag: str, attr: str, regex: str,
@@ -75,7 +74,7 @@ def removeElementAttribute(xmldoc: Document, tag: str, attr: str, regex: str,
     if not isinstance(regex, str):
         raise TypeError('Regex should be of type str!')
 
-    r = re.compile(regex)
+    r = _compile(regex)
 
     nodes = xmldoc.getElementsByTagName(tag)
 